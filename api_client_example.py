@@ -5,14 +5,25 @@ This script demonstrates how to use the API endpoints to generate TTS audio.
 """
 
 import requests
-import base64
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
 import io
+import shutil
 import soundfile as sf
 from pathlib import Path
 
 # API base URL (adjust if running on different host/port)
 API_BASE_URL = "http://localhost:8000/api"
 
+# Shared session so every call reuses pooled TCP connections instead of
+# paying a fresh handshake per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
 def ensure_test_directories():
     """Create test directories if they don't exist"""
     Path("./data/out").mkdir(parents=True, exist_ok=True)
@@ -29,7 +40,7 @@ def test_basic_generation():
         "temperature": 0.8
     }
     
-    response = requests.post(url, data=data)
+    response = SESSION.post(url, data=data)
     
     if response.status_code == 200:
         # Save the generated audio
@@ -73,7 +84,7 @@ def test_with_reference_audio():
     
     with open(reference_audio_path, "rb") as audio_file:
         files = {"reference_audio": audio_file}
-        response = requests.post(url, data=data, files=files)
+        response = SESSION.post(url, data=data, files=files)
     
     if response.status_code == 200:
         output_file = "./data/out/api_test_with_reference.wav"
@@ -84,31 +95,32 @@ def test_with_reference_audio():
         print(f"✗ Error: {response.status_code} - {response.text}")
 
 def test_json_response():
-    """Test getting audio data as base64-encoded JSON"""
+    """Test getting generation metadata as JSON with a download URL"""
     print("Testing JSON response format...")
-    
+
     url = f"{API_BASE_URL}/generate/json"
     data = {
-        "text": "This will be returned as JSON with base64 audio data.",
+        "text": "This will be returned as JSON with a download URL.",
         "exaggeration": 0.5,
         "seed": 42  # For reproducible results
     }
-    
-    response = requests.post(url, data=data)
-    
+
+    response = SESSION.post(url, data=data)
+
     if response.status_code == 200:
         result = response.json()
-        
-        # Decode the base64 audio data
-        audio_bytes = base64.b64decode(result["audio_base64"])
-        
+
+        # Fetch the audio via the returned download URL
+        audio_response = SESSION.get(f"http://localhost:8000{result['download_url']}")
+
         # Save as WAV file
         output_file = "./data/out/api_test_json.wav"
         with open(output_file, "wb") as f:
-            f.write(audio_bytes)
-        
+            f.write(audio_response.content)
+
         print(f"✓ JSON generation successful! Saved as '{output_file}'")
         print(f"  Sample rate: {result['sample_rate']}")
+        print(f"  Download URL: {result['download_url']}")
         print(f"  Parameters used: {result['parameters']}")
     else:
         print(f"✗ Error: {response.status_code} - {response.text}")
@@ -123,13 +135,15 @@ def test_streaming():
         "exaggeration": 0.8
     }
     
-    response = requests.post(url, data=data, stream=True)
-    
+    response = SESSION.post(url, data=data, stream=True)
+
     if response.status_code == 200:
         output_file = "./data/out/api_test_stream.wav"
+        # Copy straight from the raw socket to disk in 1MB chunks — skips
+        # the per-8KB Python iteration overhead of iter_content
+        response.raw.decode_content = True
         with open(output_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=1 << 20)
         print(f"✓ Streaming generation successful! Saved as '{output_file}'")
     else:
         print(f"✗ Error: {response.status_code} - {response.text}")
@@ -148,7 +162,7 @@ def test_different_formats():
             "output_format": fmt
         }
         
-        response = requests.post(url, data=data)
+        response = SESSION.post(url, data=data)
         
         if response.status_code == 200:
             filename = f"./data/out/api_test_format.{fmt}"
@@ -163,7 +177,7 @@ def test_api_info():
     print("Testing API information endpoints...")
     
     # Test root endpoint
-    response = requests.get(f"{API_BASE_URL}/")
+    response = SESSION.get(f"{API_BASE_URL}/")
     if response.status_code == 200:
         info = response.json()
         print("✓ API Info:")
@@ -171,7 +185,7 @@ def test_api_info():
         print(f"  Device: {info['device']}")
     
     # Test health check
-    response = requests.get(f"{API_BASE_URL}/health")
+    response = SESSION.get(f"{API_BASE_URL}/health")
     if response.status_code == 200:
         health = response.json()
         print("✓ Health Check:")
@@ -179,7 +193,7 @@ def test_api_info():
         print(f"  Model loaded: {health['model_loaded']}")
     
     # Test model info
-    response = requests.get(f"{API_BASE_URL}/model/info")
+    response = SESSION.get(f"{API_BASE_URL}/model/info")
     if response.status_code == 200:
         model_info = response.json()
         print("✓ Model Info:")
@@ -195,7 +209,7 @@ def main():
     
     try:
         # Test API availability
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{API_BASE_URL}/health", timeout=5)
         if response.status_code != 200:
             print("❌ API is not available. Make sure the server is running.")
             return
@@ -204,26 +218,24 @@ def main():
         return
     
     print("✅ API is available. Running tests...\n")
-    
-    # Run tests
-    test_api_info()
-    print()
-    
-    test_basic_generation()
-    print()
-    
-    test_json_response()
-    print()
-    
-    test_streaming()
-    print()
-    
-    test_different_formats()
-    print()
-    
-    test_with_reference_audio()
+
+    # Run the independent tests concurrently — total wall time becomes
+    # roughly the slowest single test instead of the sum of all of them
+    # (and this exercises the server under concurrent load)
+    tests = [
+        test_api_info,
+        test_basic_generation,
+        test_json_response,
+        test_streaming,
+        test_different_formats,
+        test_with_reference_audio,
+    ]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test) for test in tests]
+        for future in futures:
+            future.result()
+
     print()
-    
     print("🎉 All tests completed!")
     print("📂 Generated audio files saved to: ./data/out/")
     print("📂 Reference audio files saved to: ./data/ref/")
@@ -5,9 +5,19 @@ Run this after starting the API server.
 """
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import sys
 from pathlib import Path
 
+# Shared session so every call reuses pooled TCP connections instead of
+# paying a fresh handshake per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
 def ensure_test_directories():
     """Create test directories if they don't exist"""
     Path("./data/out").mkdir(parents=True, exist_ok=True)
@@ -26,7 +36,7 @@ def test_api():
     # Test 1: Health check
     print("1. Testing health check...")
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = SESSION.get(f"{base_url}/health", timeout=5)
         if response.status_code == 200:
             health_data = response.json()
             print(f"   ✅ Health check passed")
@@ -46,7 +56,7 @@ def test_api():
     # Test 2: Model info
     print("2. Testing model info...")
     try:
-        response = requests.get(f"{base_url}/model/info", timeout=5)
+        response = SESSION.get(f"{base_url}/model/info", timeout=5)
         if response.status_code == 200:
             model_data = response.json()
             print(f"   ✅ Model info retrieved")
@@ -64,7 +74,7 @@ def test_api():
     test_text = "Hello! This is a test of the Chatterbox TTS API."
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/generate",
             data={
                 "text": test_text,
@@ -96,7 +106,7 @@ def test_api():
     # Test 4: JSON response
     print("4. Testing JSON response format...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/generate/json",
             data={
                 "text": "JSON test response.",
@@ -111,8 +121,7 @@ def test_api():
             print(f"   🎵 Sample rate: {json_data['sample_rate']}")
             print(f"   📝 Text: {json_data['text']}")
             print(f"   ⚙️  Seed: {json_data['parameters']['seed']}")
-            audio_size = len(json_data['audio_base64']) * 3 // 4  # Rough base64 decode size
-            print(f"   📦 Audio data size: ~{audio_size} bytes (base64)")
+            print(f"   🔗 Download URL: {json_data['download_url']}")
         else:
             print(f"   ❌ JSON generation failed: {response.status_code}")
             
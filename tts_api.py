@@ -1,26 +1,42 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse, HTMLResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
+from fastapi.responses import StreamingResponse, ORJSONResponse, HTMLResponse, Response, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import torch
 import numpy as np
+import aiofiles
+import asyncio
 import io
 import os
+import queue
 import random
+import secrets
 from typing import Optional
+from collections import OrderedDict
 import soundfile as sf
 from pathlib import Path
-import shutil
 from datetime import datetime
+import base64
+import contextlib
+import hashlib
+import itertools
 import logging
+import struct
 import sys
+import functools
+import tempfile
 import time
 import signal
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from urllib.parse import quote
 
 from chatterbox.tts import ChatterboxTTS
 
-app = FastAPI(title="Chatterbox TTS API", version="1.0.0")
+# orjson serializes several times faster than stdlib json and handles
+# datetime/bytes natively, so every dict-returning endpoint benefits
+app = FastAPI(title="Chatterbox TTS API", version="1.0.0",
+              default_response_class=ORJSONResponse)
 
 # Configure logging
 logging.basicConfig(
@@ -43,71 +59,77 @@ app.add_middleware(
 
 # Global variables
 # Device detection with priority: ENV_VAR > CUDA > MPS > CPU
+@functools.lru_cache(maxsize=1)
+def _caps():
+    """Probe device availability exactly once; all later checks read this.
+
+    The MPS tensor probe the old code ran per check is gone — the
+    availability API is authoritative on PyTorch >= 2.1.
+    """
+    cuda = torch.cuda.is_available()
+    cuda_name = None
+    if cuda:
+        try:
+            cuda_name = torch.cuda.get_device_name(0)
+        except Exception as e:
+            logger.warning(f"⚠️ CUDA detected but not accessible: {e}")
+            cuda = False
+    return SimpleNamespace(
+        cuda=cuda,
+        mps=torch.backends.mps.is_available(),
+        cuda_name=cuda_name
+    )
+
 def detect_device():
     """Detect the best available device with proper error handling"""
+    caps = _caps()
+
     # Check for environment variable override
     env_device = os.environ.get('TORCH_DEVICE', '').lower()
     if env_device in ['cuda', 'mps', 'cpu']:
         logger.info(f"🔧 Device override from environment: {env_device}")
-        
+
         # Validate the requested device is actually available
         if env_device == 'cuda':
-            if not torch.cuda.is_available():
-                logger.warning(f"⚠️ CUDA requested but not available, falling back to auto-detection")
-            else:
-                try:
-                    torch.cuda.get_device_name(0)
-                    return "cuda"
-                except Exception as e:
-                    logger.warning(f"⚠️ CUDA requested but not accessible: {e}")
-        
+            if caps.cuda:
+                return "cuda"
+            logger.warning("⚠️ CUDA requested but not available, falling back to auto-detection")
         elif env_device == 'mps':
-            if not torch.backends.mps.is_available():
-                logger.warning(f"⚠️ MPS requested but not available, falling back to auto-detection")
-            else:
-                try:
-                    test_tensor = torch.randn(1).to("mps")
-                    return "mps"
-                except Exception as e:
-                    logger.warning(f"⚠️ MPS requested but not accessible: {e}")
-        
+            if caps.mps:
+                return "mps"
+            logger.warning("⚠️ MPS requested but not available, falling back to auto-detection")
         elif env_device == 'cpu':
             return "cpu"
-    
+
     # Auto-detection if no valid environment override
-    try:
-        if torch.cuda.is_available():
-            # Verify CUDA device is actually accessible
-            torch.cuda.get_device_name(0)
-            return "cuda"
-    except Exception as e:
-        logger.warning(f"⚠️ CUDA detected but not accessible: {e}")
-    
-    try:
-        if torch.backends.mps.is_available():
-            # Verify MPS is actually usable
-            test_tensor = torch.randn(1).to("mps")
-            return "mps"
-    except Exception as e:
-        logger.warning(f"⚠️ MPS detected but not accessible: {e}")
-    
+    if caps.cuda:
+        return "cuda"
+    if caps.mps:
+        return "mps"
+
     logger.info("💻 Falling back to CPU device")
     return "cpu"
 
 DEVICE = detect_device()
 model = None
 
+# Optional reduced-precision inference: TTS_DTYPE=bfloat16|float16 halves the
+# bytes moved per decode step on devices that support it
+_DTYPE_NAMES = {'bfloat16': torch.bfloat16, 'float16': torch.float16,
+                'float32': torch.float32, 'int8': torch.qint8}
+TTS_DTYPE = _DTYPE_NAMES.get(os.environ.get('TTS_DTYPE', '').lower())
+
 # Initialize logging early
 logger.info("🔧 System Information:")
 logger.info(f"🐍 Python: {sys.version}")
 logger.info(f"🔥 PyTorch: {torch.__version__}")
-logger.info(f"🎯 CUDA Available: {torch.cuda.is_available()}")
-logger.info(f"🍎 MPS Available: {torch.backends.mps.is_available()}")
+logger.info(f"🎯 CUDA Available: {_caps().cuda}")
+logger.info(f"🍎 MPS Available: {_caps().mps}")
 logger.info(f"📱 Selected Device: {DEVICE}")
-if torch.cuda.is_available():
-    logger.info(f"🎮 GPU: {torch.cuda.get_device_name(0)}")
+if _caps().cuda:
+    logger.info(f"🎮 GPU: {_caps().cuda_name}")
     logger.info(f"💾 GPU Memory: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.1f} GB")
-elif torch.backends.mps.is_available():
+elif _caps().mps:
     logger.info(f"🍎 MPS Device: Apple Silicon GPU")
     logger.info(f"💾 MPS Memory Management: Unified Memory Architecture")
 
@@ -115,6 +137,74 @@ elif torch.backends.mps.is_available():
 DATA_DIR = Path("./data")
 REF_AUDIO_DIR = DATA_DIR / "ref"
 OUTPUT_AUDIO_DIR = DATA_DIR / "out"
+PROMPT_CACHE_DIR = DATA_DIR / "cache" / "prompts"
+
+# Pre-stringified ref dir for the per-request prompt save: os.path.join on
+# a string is one C call vs pathlib's Python-level parse/normalize
+_REF_DIR_STR = str(REF_AUDIO_DIR)
+
+# Upload limits
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_SIZE = 1 << 20  # Stream uploads in 1MB chunks
+
+# Largest POST body accepted: the upload cap plus slack for multipart
+# framing and the small form fields
+_MAX_BODY_SIZE = MAX_UPLOAD_SIZE + UPLOAD_CHUNK_SIZE
+
+@app.middleware("http")
+async def reject_oversized_bodies(request: Request, call_next):
+    """Refuse oversized requests from the Content-Length header.
+
+    This has to happen in middleware: by the time an endpoint with an
+    UploadFile parameter runs, FastAPI has already received and spooled
+    the whole multipart body. Short-circuiting here stops the body from
+    being parsed or spooled at all. The chunked-read guards in the upload
+    paths remain the backstop for clients that omit or understate the
+    header.
+    """
+    if request.method == "POST":
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > _MAX_BODY_SIZE:
+            return ORJSONResponse(
+                {"detail": "Audio file too large (max 50MB)"}, status_code=413
+            )
+    return await call_next(request)
+
+# Audio extensions accepted for reference uploads and surfaced by the
+# list endpoints; membership check is a single hash lookup
+_LISTABLE_EXTS = frozenset({'.wav', '.mp3', '.flac', '.ogg', '.m4a'})
+
+# Extensions accepted for inline reference prompts (adds .aac, which the
+# decoder can read but the list endpoints don't surface)
+_UPLOAD_EXTS = _LISTABLE_EXTS | {'.aac'}
+
+# Download media type by extension; one dict lookup instead of an
+# if/elif ladder per download
+_MEDIA_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+    ".aac": "audio/aac",
+}
+
+# Output format dispatch: request format -> (libsndfile format, subtype, media type, extension)
+# Vorbis/Opus encode much faster than MP3 and are preferred for streaming
+FORMAT_TABLE = {
+    "wav": ("WAV", "PCM_16", "audio/wav", ".wav"),
+    "mp3": ("MP3", None, "audio/mpeg", ".mp3"),
+    "flac": ("FLAC", "PCM_16", "audio/flac", ".flac"),
+    "ogg": ("OGG", "VORBIS", "audio/ogg", ".ogg"),
+    "opus": ("OGG", "OPUS", "audio/opus", ".opus"),
+}
+
+# Drop formats the installed libsndfile build can't encode (e.g. Opus on
+# older builds) so requests fail over to WAV instead of erroring mid-encode
+FORMAT_TABLE = {
+    fmt: spec for fmt, spec in FORMAT_TABLE.items()
+    if sf.check_format(spec[0], spec[1])
+}
 
 def ensure_directories():
     """Create data directories if they don't exist"""
@@ -122,8 +212,147 @@ def ensure_directories():
     REF_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
     logger.info(f"📁 Creating directory: {OUTPUT_AUDIO_DIR}")
     OUTPUT_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+    logger.info(f"📁 Creating directory: {PROMPT_CACHE_DIR}")
+    PROMPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     logger.info("📁 All directories ready")
 
+# ~1 second of audio per streamed chunk at the model's 24kHz rate
+STREAM_CHUNK_SAMPLES = 24000
+
+def to_int16(audio_data):
+    """Vectorized float32 -> little-endian int16 PCM conversion.
+
+    numpy's clip/multiply/cast all run through SIMD kernels, which beats
+    libsndfile's scalar float->int loop and lets sf.write skip its own
+    conversion pass when handed int16 data.
+    """
+    return np.clip(audio_data * 32767.0, -32768, 32767).astype('<i2')
+
+def _build_wav_header(sample_rate, channels=1, bits_per_sample=16, data_size=0xFFFFFFFF - 36):
+    """Build a 44-byte RIFF/WAVE header for 16-bit PCM data"""
+    byte_rate = sample_rate * channels * bits_per_sample // 8
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample,
+        b'data', data_size,
+    )
+
+# Header templates keyed by sample rate; built once, then per-request only
+# the two payload-length fields get patched in
+_WAV_HEADER_CACHE = {}
+
+def wav_bytes(pcm_bytes, sample_rate):
+    """Assemble a complete WAV payload from raw int16 PCM bytes"""
+    template = _WAV_HEADER_CACHE.get(sample_rate)
+    if template is None:
+        template = _WAV_HEADER_CACHE[sample_rate] = _build_wav_header(sample_rate)
+    header = bytearray(template)
+    struct.pack_into('<I', header, 4, 36 + len(pcm_bytes))
+    struct.pack_into('<I', header, 40, len(pcm_bytes))
+    return bytes(header) + pcm_bytes
+
+# Reusable in-memory encode buffers for the compressed formats (the WAV
+# fast path never allocates one). LIFO hands back the most recently used
+# buffer, which is already grown to clip size and still cache-warm.
+_BUF_POOL = queue.LifoQueue(maxsize=32)
+
+@contextlib.contextmanager
+def _encode_buffer():
+    """Borrow a BytesIO from the pool; reset and return it afterwards"""
+    try:
+        buffer = _BUF_POOL.get_nowait()
+    except queue.Empty:
+        buffer = io.BytesIO()
+    try:
+        yield buffer
+    finally:
+        buffer.seek(0)
+        buffer.truncate(0)
+        with contextlib.suppress(queue.Full):
+            _BUF_POOL.put_nowait(buffer)
+
+def encode_audio(audio_data, sample_rate, fmt):
+    """Encode audio in memory and return (bytes, media_type, extension)"""
+    sf_format, subtype, media_type, extension = FORMAT_TABLE[fmt]
+    # Convert once up front; PCM_16 containers then store the samples as-is
+    pcm = to_int16(audio_data) if audio_data.dtype != np.int16 else audio_data
+    # WAV fast path: patch sizes into a cached header template and append
+    # the PCM — no libsndfile call at all for the most common format
+    if sf_format == 'WAV':
+        return wav_bytes(pcm.tobytes(), sample_rate), media_type, extension
+    with _encode_buffer() as buffer:
+        return _encode_with_sf(buffer, pcm, sample_rate,
+                               sf_format, subtype, media_type, extension)
+
+def _encode_with_sf(buffer, pcm, sample_rate, sf_format, subtype, media_type, extension):
+    try:
+        with sf.SoundFile(buffer, mode='w', samplerate=sample_rate, channels=1,
+                          format=sf_format, subtype=subtype) as out:
+            out.write(pcm)
+    except Exception:
+        if sf_format != "MP3":
+            raise
+        # Older libsndfile builds can't encode MP3 to memory; fall back to a temp file
+        with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            sf.write(tmp_path, pcm, sample_rate, format=sf_format)
+            with open(tmp_path, "rb") as f:
+                return f.read(), media_type, extension
+        finally:
+            os.unlink(tmp_path)
+    return bytes(buffer.getbuffer()), media_type, extension
+
+def _content_disposition(filename, disposition="attachment"):
+    """Build a Content-Disposition value that survives any filename.
+
+    ASCII names pass through quoted; anything else uses the RFC 5987
+    filename* form, since Starlette encodes headers as latin-1 and a raw
+    unicode name would raise mid-response.
+    """
+    if filename.isascii():
+        return f'{disposition}; filename="{filename}"'
+    return f"{disposition}; filename*=UTF-8''{quote(filename)}"
+
+# Epoch seconds keep generated filenames sortable; the counter suffix
+# disambiguates requests landing in the same second, where the old
+# strftime-based names collided under concurrency. The counter is
+# per-process, so a pid token keeps stamps unique across --workers N
+# processes whose counters advance in near-lockstep.
+_name_seq = itertools.count()
+_proc_token = f"{os.getpid():x}"
+
+def output_stamp():
+    """Return a unique, sortable timestamp token for generated filenames"""
+    return f"{int(time.time())}_{_proc_token}_{next(_name_seq):04x}"
+
+def _write_bytes(path, data):
+    """Write an encoded audio payload to disk in a single call"""
+    # Size the buffer to the payload (min 1MB) so multi-MB audio goes out
+    # in a few large writes instead of many 8KB syscalls
+    with open(path, "wb", buffering=max(len(data), 1 << 20)) as f:
+        f.write(data)
+
+# Strong references to fire-and-forget persistence tasks so they aren't
+# garbage collected mid-write
+_persist_tasks = set()
+
+def _persist_async(path, data):
+    """Persist generated audio to disk without holding up the response"""
+    task = asyncio.create_task(asyncio.to_thread(_write_bytes, path, data))
+    _persist_tasks.add(task)
+
+    def _on_done(t):
+        _persist_tasks.discard(t)
+        # Retrieve the outcome so a failed write (disk full, permissions)
+        # is logged instead of dying as a garbage-collection warning
+        if not t.cancelled() and t.exception() is not None:
+            logger.error(f"❌ Failed to persist audio to {path}: {t.exception()}")
+
+    task.add_done_callback(_on_done)
+
 def set_seed(seed: int):
     """Set random seed for reproducibility"""
     torch.manual_seed(seed)
@@ -131,90 +360,277 @@ def set_seed(seed: int):
     random.seed(seed)
     
     # Set device-specific seeds
-    if torch.cuda.is_available():
+    if _caps().cuda:
         torch.cuda.manual_seed(seed)
         torch.cuda.manual_seed_all(seed)
     
     # MPS doesn't have a separate manual_seed function as of PyTorch 2.x
     # The torch.manual_seed should handle MPS devices
 
-def load_model_with_timeout(timeout_seconds=300):
-    """Load the TTS model with timeout handling"""
-    logger.info("🔄 Starting model loading with timeout...")
-    
-    result = {'model': None, 'error': None, 'completed': False}
-    
-    def model_loader():
-        try:
-            logger.info(f"📱 Device: {DEVICE}")
-            logger.info("🌐 Checking internet connectivity...")
-            
-            # Test internet connection
-            import urllib.request
+def _apply_dtype(model):
+    """Cast the heavy submodules to the configured reduced precision.
+
+    The voice-encoder path is kept at fp32 — casting it introduces audible
+    vocoder artifacts.
+    """
+    if TTS_DTYPE is torch.qint8:
+        # Dynamic W8 quantization of the Linear layers; CPU-only in PyTorch
+        if DEVICE != 'cpu':
+            logger.warning("⚠️ TTS_DTYPE=int8 (dynamic quantization) only applies on CPU, ignoring")
+            return
+        for name in ('t3', 's3gen'):
+            submodule = getattr(model, name, None)
+            if submodule is not None:
+                setattr(model, name, torch.ao.quantization.quantize_dynamic(
+                    submodule, {torch.nn.Linear}, dtype=torch.qint8))
+        logger.info("🧮 Linear layers dynamically quantized to INT8")
+        return
+    if TTS_DTYPE not in (torch.bfloat16, torch.float16):
+        return
+    for name in ('t3', 's3gen'):
+        submodule = getattr(model, name, None)
+        if submodule is not None:
+            submodule.to(TTS_DTYPE)
+    logger.info(f"🧮 Model cast to {TTS_DTYPE} (voice encoder kept at fp32)")
+
+def _autocast():
+    """Autocast context for reduced-precision inference (no-op at fp32)"""
+    if TTS_DTYPE in (torch.bfloat16, torch.float16):
+        return torch.autocast(device_type=DEVICE, dtype=TTS_DTYPE)
+    return contextlib.nullcontext()
+
+def _maybe_compile(model):
+    """Apply torch.compile to the transformer submodule when TORCH_COMPILE=1"""
+    if os.environ.get('TORCH_COMPILE', '0') != '1':
+        return
+    if not hasattr(torch, 'compile') or not hasattr(model, 't3'):
+        logger.warning("⚠️ torch.compile requested but not supported on this setup")
+        return
+    try:
+        model.t3 = torch.compile(model.t3, mode='reduce-overhead', fullgraph=False)
+        logger.info("⚡ torch.compile enabled on the T3 transformer")
+    except Exception as e:
+        logger.warning(f"⚠️ torch.compile failed, continuing with eager mode: {e}")
+
+MODEL_LOAD_TIMEOUT = 600  # seconds
+
+def _load_model_sync():
+    """Load ChatterboxTTS from Hugging Face (blocking; run off the event loop)"""
+    global _default_conds
+    logger.info(f"📱 Device: {DEVICE}")
+    logger.info("🌐 Checking internet connectivity...")
+
+    # Test internet connection
+    import urllib.request
+    try:
+        urllib.request.urlopen('https://huggingface.co', timeout=10)
+        logger.info("✅ Internet connectivity confirmed")
+    except Exception as e:
+        logger.error(f"❌ Internet connectivity issue: {e}")
+        raise RuntimeError(f"Internet connectivity issue: {e}")
+
+    logger.info("⬇️ Starting model download/loading from Hugging Face...")
+    logger.info("📦 This may take several minutes for first-time download...")
+
+    # Log environment info
+    logger.info(f"🔧 Python executable: {sys.executable}")
+    logger.info(f"🔧 PyTorch version: {torch.__version__}")
+    logger.info(f"🎯 CUDA available: {_caps().cuda}")
+    logger.info(f"🍎 MPS available: {_caps().mps}")
+    if DEVICE == "cuda":
+        logger.info(f"🎮 CUDA device: {_caps().cuda_name}")
+    elif DEVICE == "mps":
+        logger.info(f"🍎 MPS device: Apple Silicon GPU")
+
+    start_time = time.time()
+    loaded = ChatterboxTTS.from_pretrained(DEVICE)
+    _default_conds = getattr(loaded, 'conds', None)
+    _apply_dtype(loaded)
+    _maybe_compile(loaded)
+    load_time = time.time() - start_time
+
+    logger.info(f"✅ Model loaded successfully in {load_time:.1f} seconds!")
+    return loaded
+
+# Pinned staging buffer for GPU->CPU waveform copies (CUDA only), grown on
+# demand and reused across requests
+_pin_buffer = None
+
+def _tensor_to_numpy(wav):
+    """Move a generated waveform to CPU and return it as float32 numpy.
+
+    On CUDA, copy through a pinned staging buffer with non_blocking=True so
+    the transfer overlaps in-flight stream work instead of triggering an
+    implicit blocking sync; elsewhere a plain copy is already optimal.
+    """
+    global _pin_buffer
+    wav = wav.detach().squeeze(0)
+    if wav.dtype != torch.float32:
+        wav = wav.float()
+    if wav.is_cuda:
+        flat = wav.reshape(-1)
+        if _pin_buffer is None or _pin_buffer.numel() < flat.numel():
+            _pin_buffer = torch.empty(flat.numel(), dtype=flat.dtype, pin_memory=True)
+        staging = _pin_buffer[:flat.numel()]
+        staging.copy_(flat, non_blocking=True)
+        torch.cuda.current_stream().synchronize()
+        # Copy out of the staging buffer since it gets reused next request
+        return staging.numpy().copy()
+    return wav.cpu().numpy()
+
+# Reference-audio conditionals cache: content hash -> prepared conditionals.
+# Skips the speaker/prosody encoder pass when the same voice repeats.
+COND_CACHE_SIZE = 256
+_cond_cache: OrderedDict = OrderedDict()
+_default_conds = None  # built-in voice conditionals captured at model load
+
+def _hash_file(path):
+    """Content hash of a reference audio file (blake2b, streamed)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _apply_conditionals(tts_model, gen_kwargs):
+    """Swap in cached conditionals for a reference prompt when possible.
+
+    On a cache hit the prompt path is dropped from the kwargs so generate()
+    skips its own prompt-encoding pass. No-op when the model doesn't expose
+    prepare_conditionals.
+    """
+    if not hasattr(tts_model, 'prepare_conditionals'):
+        return
+    path = gen_kwargs['audio_prompt_path']
+    exaggeration = gen_kwargs.get('exaggeration', 0.5)
+    key = f"{_hash_file(path)}_{exaggeration}"
+    cached = _cond_cache.get(key)
+    if cached is None:
+        # Second-level cache on disk: prepared conditionals survive restarts
+        # since the ref folder itself is persistent
+        cache_file = PROMPT_CACHE_DIR / f"{key}.pt"
+        if cache_file.exists():
             try:
-                urllib.request.urlopen('https://huggingface.co', timeout=10)
-                logger.info("✅ Internet connectivity confirmed")
+                cached = torch.load(cache_file, map_location=tts_model.device, weights_only=False)
             except Exception as e:
-                logger.error(f"❌ Internet connectivity issue: {e}")
-                result['error'] = f"Internet connectivity issue: {e}"
-                return
-            
-            logger.info("⬇️ Starting model download/loading from Hugging Face...")
-            logger.info("📦 This may take several minutes for first-time download...")
-            
-            # Log environment info
-            logger.info(f"🔧 Python executable: {sys.executable}")
-            logger.info(f"🔧 PyTorch version: {torch.__version__}")
-            logger.info(f"🎯 CUDA available: {torch.cuda.is_available()}")
-            logger.info(f"🍎 MPS available: {torch.backends.mps.is_available()}")
-            if torch.cuda.is_available() and DEVICE == "cuda":
-                logger.info(f"🎮 CUDA device: {torch.cuda.get_device_name(0)}")
-            elif torch.backends.mps.is_available() and DEVICE == "mps":
-                logger.info(f"🍎 MPS device: Apple Silicon GPU")
-            
-            start_time = time.time()
-            model = ChatterboxTTS.from_pretrained(DEVICE)
-            load_time = time.time() - start_time
-            
-            logger.info(f"✅ Model loaded successfully in {load_time:.1f} seconds!")
-            result['model'] = model
-            result['completed'] = True
-            
+                logger.warning(f"⚠️ Ignoring unreadable prompt cache {cache_file.name}: {e}")
+    if cached is None:
+        tts_model.prepare_conditionals(path, exaggeration=exaggeration)
+        cached = tts_model.conds
+        try:
+            torch.save(cached, PROMPT_CACHE_DIR / f"{key}.pt")
         except Exception as e:
-            logger.error(f"❌ Model loading failed: {e}")
-            result['error'] = str(e)
-    
-    # Start model loading in a separate thread
-    thread = threading.Thread(target=model_loader)
-    thread.daemon = True
-    thread.start()
-    
-    # Wait for completion or timeout
-    start_time = time.time()
-    while thread.is_alive() and (time.time() - start_time) < timeout_seconds:
-        elapsed = time.time() - start_time
-        if elapsed % 30 < 1:  # Log every 30 seconds
-            logger.info(f"⏳ Model loading in progress... {elapsed:.0f}s elapsed (timeout: {timeout_seconds}s)")
-        time.sleep(1)
-    
-    if thread.is_alive():
-        logger.error(f"⏰ Model loading timed out after {timeout_seconds} seconds")
-        return None, f"Model loading timed out after {timeout_seconds} seconds"
-    
-    if result['error']:
-        return None, result['error']
-    
-    return result['model'], None
+            logger.warning(f"⚠️ Failed to persist prompt cache for {key}: {e}")
+    else:
+        tts_model.conds = cached
+    _cond_cache[key] = cached
+    _cond_cache.move_to_end(key)
+    if len(_cond_cache) > COND_CACHE_SIZE:
+        _cond_cache.popitem(last=False)
+    gen_kwargs['audio_prompt_path'] = None
+
+# Micro-batching scheduler settings
+MAX_BATCH_SIZE = 8
+BATCH_WINDOW_MS = 20
+
+class BatchScheduler:
+    """Coalesce concurrent generate requests into batched model runs.
+
+    ChatterboxTTS doesn't expose a batched generate call, so each drained
+    batch is executed back-to-back inside a single worker thread. This keeps
+    the device fed between requests and the event loop free while audio is
+    being generated.
+    """
+
+    def __init__(self, max_batch=MAX_BATCH_SIZE, batch_window_ms=BATCH_WINDOW_MS):
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000.0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        """Start the background worker task (call from a running event loop)"""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._worker())
+
+    async def submit(self, seed, gen_kwargs):
+        """Queue one generate call and wait for its waveform"""
+        if self._task is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((seed, gen_kwargs, future))
+        return await future
+
+    async def _worker(self):
+        while True:
+            # Block for the first job, then collect whatever else arrives
+            # within the batching window (up to max_batch)
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await asyncio.to_thread(self._run_batch, batch)
+
+    @staticmethod
+    def _resolve(future, setter, value):
+        """Complete a submitted future, skipping ones a disconnecting
+        client already cancelled (runs on the loop thread)."""
+        if not future.done():
+            setter(value)
+
+    def _run_batch(self, batch):
+        tts_model = load_model()
+        # inference_mode is cheaper than no_grad: no autograd bookkeeping
+        # at all for the whole drained batch
+        with torch.inference_mode(), _autocast():
+            for seed, gen_kwargs, future in batch:
+                loop = future.get_loop()
+                try:
+                    if seed != 0:
+                        set_seed(seed)
+                    if gen_kwargs.get('audio_prompt_path'):
+                        _apply_conditionals(tts_model, gen_kwargs)
+                    elif _default_conds is not None:
+                        # Restore the built-in voice in case a previous job
+                        # left cached reference conditionals on the model
+                        tts_model.conds = _default_conds
+                    wav = tts_model.generate(**gen_kwargs)
+                    loop.call_soon_threadsafe(
+                        self._resolve, future, future.set_result, wav)
+                except Exception as e:
+                    loop.call_soon_threadsafe(
+                        self._resolve, future, future.set_exception, e)
+
+SCHEDULER = BatchScheduler()
 
 def load_model():
-    """Load the TTS model"""
+    """Load the TTS model (synchronous; safe to call from worker threads)"""
+    global model
+    if model is None:
+        logger.info("🚀 Initializing model loading...")
+        model = _load_model_sync()
+        logger.info("✅ Model successfully initialized!")
+    return model
+
+async def load_model_async(timeout_seconds=MODEL_LOAD_TIMEOUT):
+    """Load the TTS model off-loop with a timeout, keeping the loop responsive"""
     global model
     if model is None:
         logger.info("🚀 Initializing model loading...")
-        model, error = load_model_with_timeout(timeout_seconds=600)  # 10 minute timeout
-        if error:
-            logger.error(f"❌ Failed to load model: {error}")
-            raise RuntimeError(f"Model loading failed: {error}")
+        try:
+            model = await asyncio.wait_for(
+                asyncio.to_thread(_load_model_sync), timeout=timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"⏰ Model loading timed out after {timeout_seconds} seconds")
+            raise RuntimeError(f"Model loading timed out after {timeout_seconds} seconds")
         logger.info("✅ Model successfully initialized!")
     return model
 
@@ -225,6 +641,31 @@ async def startup_event():
     logger.info("🚀 Starting Chatterbox TTS API...")
     logger.info("🚀 ========================================")
     
+    # Dedicated default executor so to_thread offloads (encoding, disk
+    # writes) don't contend with unrelated work on the stock pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=8, thread_name_prefix="tts-io")
+    )
+
+    if DEVICE == "cuda":
+        # TF32 matmuls and cuDNN autotuning are free throughput on Ampere+
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+        logger.info("⚡ TF32 matmul and cuDNN benchmark enabled")
+    elif DEVICE == "cpu":
+        # PyTorch defaults to one intra-op thread per core, which oversubscribes
+        # small-batch autoregressive decoding; half the cores is a better
+        # default and OMP_NUM_THREADS still wins when set
+        os.environ.setdefault("MKL_DYNAMIC", "FALSE")
+        num_threads = int(os.environ.get("OMP_NUM_THREADS", max(1, (os.cpu_count() or 2) // 2)))
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # already configured (e.g. dev reload); can only be set once
+        logger.info(f"🧵 CPU inference threads: {num_threads} intra-op, 1 inter-op")
+
     try:
         logger.info("📁 Step 1/2: Creating data directories...")
         ensure_directories()
@@ -232,9 +673,25 @@ async def startup_event():
         
         logger.info("🤖 Step 2/2: Loading TTS model...")
         logger.info("⚠️  This step may take several minutes on first run...")
-        
-        load_model()
-        
+
+        await load_model_async()
+
+        logger.info("📬 Starting generation scheduler...")
+        SCHEDULER.start()
+
+        # Warm the model before serving traffic so the first real request
+        # doesn't pay the first-call cliff (huge when TORCH_COMPILE=1).
+        # Disable with TTS_WARMUP=0 for faster dev restarts.
+        if os.environ.get("TTS_WARMUP", "1") == "1":
+            warmup_runs = 2 if os.environ.get("TORCH_COMPILE", "0") == "1" else 1
+            logger.info(f"🔥 Running {warmup_runs} warmup generation(s)...")
+            try:
+                for _ in range(warmup_runs):
+                    await SCHEDULER.submit(0, dict(text="Warm up."))
+                logger.info("🔥 Warmup complete")
+            except Exception as e:
+                logger.warning(f"⚠️ Warmup generation failed: {e}")
+
         logger.info("✅ ========================================")
         logger.info("✅ Startup completed successfully!")
         logger.info("✅ API is ready to receive requests")
@@ -257,6 +714,7 @@ async def root():
             "demo": "/api_demo.html - Interactive API demo page",
             "generate": "/api/generate - Generate TTS audio",
             "generate_stream": "/api/generate/stream - Generate and stream TTS audio",
+            "generate_pcm": "/api/generate/pcm - Generate and return raw 16-bit PCM samples",
             "health": "/api/health - Health check",
             "model_info": "/api/model/info - Model information",
             "reference_audio_list": "/api/reference-audio/list - List reference audio files",
@@ -296,15 +754,68 @@ async def model_info():
     if model is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
     
-    return {
+    info = {
         "sample_rate": model.sr,
         "device": model.device,
-        "model_type": "ChatterboxTTS"
+        "model_type": "ChatterboxTTS",
+        "dtype": str(TTS_DTYPE) if TTS_DTYPE else "torch.float32"
     }
+    if DEVICE == "cuda":
+        info["gpu_memory_allocated_gb"] = round(torch.cuda.memory_allocated() / 1024**3, 2)
+    return info
+
+async def _run_generation(text, reference_audio, reference_audio_file,
+                          exaggeration, temperature, cfg_weight, min_p,
+                          top_p, repetition_penalty, seed):
+    """Shared generation core for the /generate* endpoints.
+
+    Resolves the reference prompt, queues the job on the scheduler, and
+    returns (audio_data, sample_rate) with the waveform as float32 numpy.
+    """
+    # Fail fast on blank input instead of spending a model execution on it
+    if not text or not text.strip():
+        raise HTTPException(status_code=400, detail="Text must not be empty")
+
+    # Load model if not already loaded
+    tts_model = load_model()
+
+    # Handle reference audio if provided
+    audio_prompt_path = None
+    if reference_audio:
+        try:
+            audio_prompt_path = await save_uploaded_audio(reference_audio)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Error processing reference audio: {str(e)}")
+    elif reference_audio_file:
+        # Use existing reference audio file
+        ref_path = REF_AUDIO_DIR / reference_audio_file
+        if not ref_path.exists():
+            raise HTTPException(status_code=404, detail=f"Reference audio file not found: {reference_audio_file}")
+        audio_prompt_path = str(ref_path)
+
+    # Generate audio via the shared scheduler (seed is applied on the
+    # worker thread right before the model runs)
+    wav = await SCHEDULER.submit(seed, dict(
+        text=text,
+        audio_prompt_path=audio_prompt_path,
+        exaggeration=exaggeration,
+        temperature=temperature,
+        cfg_weight=cfg_weight,
+        min_p=min_p,
+        top_p=top_p,
+        repetition_penalty=repetition_penalty,
+    ))
+
+    # Note: reference audio files are kept in the ref folder for future use
+
+    # Convert to numpy array
+    return _tensor_to_numpy(wav), tts_model.sr
 
 @app.post("/api/generate")
 async def generate_tts(
-    text: str = Form(..., description="Text to synthesize (max 300 chars)"),
+    text: str = Form(..., max_length=300, description="Text to synthesize (max 300 chars)"),
     reference_audio: Optional[UploadFile] = File(None, description="Reference audio file for voice cloning"),
     reference_audio_file: Optional[str] = Form(None, description="Existing reference audio filename from ./data/ref/"),
     exaggeration: float = Form(0.5, ge=0.25, le=2.0, description="Emotion exaggeration (0.25-2.0, neutral=0.5)"),
@@ -314,97 +825,44 @@ async def generate_tts(
     top_p: float = Form(1.0, ge=0.0, le=1.0, description="Top-p sampling parameter"),
     repetition_penalty: float = Form(1.2, ge=1.0, le=2.0, description="Repetition penalty"),
     seed: int = Form(0, description="Random seed (0 for random)"),
-    output_format: str = Form("wav", description="Output format (wav, mp3, flac)")
+    output_format: str = Form("wav", description="Output format (wav, mp3, flac, ogg, opus)")
 ):
     """Generate TTS audio and return as downloadable file"""
     try:
-        # Load model if not already loaded
-        tts_model = load_model()
-        
-        # Set seed if specified
-        if seed != 0:
-            set_seed(seed)
-        
-        # Handle reference audio if provided
-        audio_prompt_path = None
-        if reference_audio:
-            try:
-                audio_prompt_path = await save_uploaded_audio(reference_audio)
-            except HTTPException:
-                raise
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Error processing reference audio: {str(e)}")
-        elif reference_audio_file:
-            # Use existing reference audio file
-            ref_path = REF_AUDIO_DIR / reference_audio_file
-            if not ref_path.exists():
-                raise HTTPException(status_code=404, detail=f"Reference audio file not found: {reference_audio_file}")
-            audio_prompt_path = str(ref_path)
-        
-        # Generate audio
-        wav = tts_model.generate(
-            text=text,
-            audio_prompt_path=audio_prompt_path,
-            exaggeration=exaggeration,
-            temperature=temperature,
-            cfg_weight=cfg_weight,
-            min_p=min_p,
-            top_p=top_p,
-            repetition_penalty=repetition_penalty,
+        # Run the shared generation core
+        audio_data, sample_rate = await _run_generation(
+            text, reference_audio, reference_audio_file, exaggeration,
+            temperature, cfg_weight, min_p, top_p, repetition_penalty, seed
         )
         
-        # Note: Keep reference audio file in ref folder for future use
-        # No longer deleting: if audio_prompt_path and os.path.exists(audio_prompt_path): os.unlink(audio_prompt_path)
-        
-        # Convert to numpy array
-        audio_data = wav.squeeze(0).numpy()
-        
         # Generate timestamped filename for output
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create audio file in memory
-        output_buffer = io.BytesIO()
-        
-        if output_format.lower() == "mp3":
-            # For MP3, we need to use a temporary file since soundfile doesn't support MP3 in memory
-            output_filename = f"generated_{timestamp}.mp3"
-            output_file_path = OUTPUT_AUDIO_DIR / output_filename
-            sf.write(str(output_file_path), audio_data, tts_model.sr, format='MP3')
-            with open(output_file_path, 'rb') as f:
-                output_buffer.write(f.read())
-            media_type = "audio/mpeg"
-            filename = output_filename
-        elif output_format.lower() == "flac":
-            output_filename = f"generated_{timestamp}.flac"
-            output_file_path = OUTPUT_AUDIO_DIR / output_filename
-            sf.write(output_buffer, audio_data, tts_model.sr, format='FLAC')
-            # Also save to disk
-            sf.write(str(output_file_path), audio_data, tts_model.sr, format='FLAC')
-            media_type = "audio/flac"
-            filename = output_filename
-        else:  # Default to WAV
-            output_filename = f"generated_{timestamp}.wav"
-            output_file_path = OUTPUT_AUDIO_DIR / output_filename
-            sf.write(output_buffer, audio_data, tts_model.sr, format='WAV')
-            # Also save to disk
-            sf.write(str(output_file_path), audio_data, tts_model.sr, format='WAV')
-            media_type = "audio/wav"
-            filename = output_filename
-        
-        output_buffer.seek(0)
-        
-        return StreamingResponse(
-            io.BytesIO(output_buffer.read()),
+        timestamp = output_stamp()
+
+        # Encode once in memory, then persist the same bytes to disk
+        fmt = output_format.lower()
+        if fmt not in FORMAT_TABLE:
+            fmt = "wav"
+        data, media_type, extension = await asyncio.to_thread(
+            encode_audio, audio_data, sample_rate, fmt
+        )
+        output_filename = f"generated_{timestamp}{extension}"
+        output_file_path = OUTPUT_AUDIO_DIR / output_filename
+        _persist_async(output_file_path, data)
+
+        return Response(
+            data,
             media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={"Content-Disposition": _content_disposition(output_filename)}
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
 @app.post("/api/generate/stream")
 async def generate_tts_stream(
-    text: str = Form(..., description="Text to synthesize (max 300 chars)"),
+    text: str = Form(..., max_length=300, description="Text to synthesize (max 300 chars)"),
     reference_audio: Optional[UploadFile] = File(None, description="Reference audio file for voice cloning"),
     reference_audio_file: Optional[str] = Form(None, description="Existing reference audio filename from ./data/ref/"),
     exaggeration: float = Form(0.5, ge=0.25, le=2.0, description="Emotion exaggeration (0.25-2.0, neutral=0.5)"),
@@ -417,75 +875,89 @@ async def generate_tts_stream(
 ):
     """Generate TTS audio and stream it directly"""
     try:
-        # Load model if not already loaded
-        tts_model = load_model()
-        
-        # Set seed if specified
-        if seed != 0:
-            set_seed(seed)
-        
-        # Handle reference audio if provided
-        audio_prompt_path = None
-        if reference_audio:
-            try:
-                audio_prompt_path = await save_uploaded_audio(reference_audio)
-            except HTTPException:
-                raise
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Error processing reference audio: {str(e)}")
-        elif reference_audio_file:
-            # Use existing reference audio file
-            ref_path = REF_AUDIO_DIR / reference_audio_file
-            if not ref_path.exists():
-                raise HTTPException(status_code=404, detail=f"Reference audio file not found: {reference_audio_file}")
-            audio_prompt_path = str(ref_path)
-        
-        # Generate audio
-        wav = tts_model.generate(
-            text=text,
-            audio_prompt_path=audio_prompt_path,
-            exaggeration=exaggeration,
-            temperature=temperature,
-            cfg_weight=cfg_weight,
-            min_p=min_p,
-            top_p=top_p,
-            repetition_penalty=repetition_penalty,
+        # Run the shared generation core
+        audio_data, sample_rate = await _run_generation(
+            text, reference_audio, reference_audio_file, exaggeration,
+            temperature, cfg_weight, min_p, top_p, repetition_penalty, seed
         )
         
-        # Note: Keep reference audio file in ref folder for future use
-        # No longer deleting: if audio_prompt_path and os.path.exists(audio_prompt_path): os.unlink(audio_prompt_path)
-        
-        # Convert to numpy array
-        audio_data = wav.squeeze(0).numpy()
-        
         # Generate timestamped filename and save to out folder
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = output_stamp()
         output_filename = f"generated_stream_{timestamp}.wav"
         output_file_path = OUTPUT_AUDIO_DIR / output_filename
         
-        # Create WAV file in memory for streaming
-        output_buffer = io.BytesIO()
-        sf.write(output_buffer, audio_data, tts_model.sr, format='WAV')
-        output_buffer.seek(0)
-        
-        # Also save to disk in out folder
-        sf.write(str(output_file_path), audio_data, tts_model.sr, format='WAV')
-        
+        # Convert to int16 PCM once, then stream header + PCM chunks so the
+        # client can start decoding before the full payload is in flight.
+        # (ChatterboxTTS has no incremental generate API, so this chunks the
+        # finished waveform rather than buffering one monolithic WAV.)
+        pcm = to_int16(audio_data)
+        header = _build_wav_header(sample_rate, data_size=pcm.nbytes)
+
+        # Also save the complete WAV to disk in out folder
+        _persist_async(output_file_path, header + pcm.tobytes())
+
+        async def pcm_chunks():
+            yield header
+            for start in range(0, len(pcm), STREAM_CHUNK_SAMPLES):
+                yield pcm[start:start + STREAM_CHUNK_SAMPLES].tobytes()
+
         return StreamingResponse(
-            io.BytesIO(output_buffer.read()),
+            pcm_chunks(),
             media_type="audio/wav",
             headers={
-                "Content-Disposition": f"inline; filename={output_filename}",
+                "Content-Disposition": _content_disposition(output_filename, "inline"),
                 "Cache-Control": "no-cache"
             }
         )
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
+
+@app.post("/api/generate/pcm")
+async def generate_tts_pcm(
+    text: str = Form(..., max_length=300, description="Text to synthesize (max 300 chars)"),
+    reference_audio: Optional[UploadFile] = File(None, description="Reference audio file for voice cloning"),
+    reference_audio_file: Optional[str] = Form(None, description="Existing reference audio filename from ./data/ref/"),
+    exaggeration: float = Form(0.5, ge=0.25, le=2.0, description="Emotion exaggeration (0.25-2.0, neutral=0.5)"),
+    temperature: float = Form(0.8, ge=0.05, le=5.0, description="Sampling temperature"),
+    cfg_weight: float = Form(0.5, ge=0.0, le=1.0, description="CFG/Pace control"),
+    min_p: float = Form(0.05, ge=0.0, le=1.0, description="Min-p sampling parameter"),
+    top_p: float = Form(1.0, ge=0.0, le=1.0, description="Top-p sampling parameter"),
+    repetition_penalty: float = Form(1.2, ge=1.0, le=2.0, description="Repetition penalty"),
+    seed: int = Form(0, description="Random seed (0 for random)")
+):
+    """Generate TTS audio and return raw 16-bit PCM with no container encoding"""
+    try:
+        # Run the shared generation core
+        audio_data, sample_rate = await _run_generation(
+            text, reference_audio, reference_audio_file, exaggeration,
+            temperature, cfg_weight, min_p, top_p, repetition_penalty, seed
+        )
+
+        # Raw little-endian int16 samples; format details travel in headers,
+        # so no libsndfile encode pass is needed at all
+        pcm = to_int16(audio_data).tobytes()
+
+        return Response(
+            pcm,
+            media_type="application/octet-stream",
+            headers={
+                "X-Sample-Rate": str(sample_rate),
+                "X-Channels": "1",
+                "X-Bit-Depth": "16"
+            }
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
 @app.post("/api/generate/json")
 async def generate_tts_json(
-    text: str = Form(..., description="Text to synthesize (max 300 chars)"),
+    text: str = Form(..., max_length=300, description="Text to synthesize (max 300 chars)"),
     reference_audio: Optional[UploadFile] = File(None, description="Reference audio file for voice cloning"),
     reference_audio_file: Optional[str] = Form(None, description="Existing reference audio filename from ./data/ref/"),
     exaggeration: float = Form(0.5, ge=0.25, le=2.0, description="Emotion exaggeration (0.25-2.0, neutral=0.5)"),
@@ -494,73 +966,32 @@ async def generate_tts_json(
     min_p: float = Form(0.05, ge=0.0, le=1.0, description="Min-p sampling parameter"),
     top_p: float = Form(1.0, ge=0.0, le=1.0, description="Top-p sampling parameter"),
     repetition_penalty: float = Form(1.2, ge=1.0, le=2.0, description="Repetition penalty"),
-    seed: int = Form(0, description="Random seed (0 for random)")
+    seed: int = Form(0, description="Random seed (0 for random)"),
+    include_audio: bool = Form(False, description="Inline the audio as base64 (larger, slower response)")
 ):
-    """Generate TTS audio and return audio data as base64 encoded JSON"""
-    import base64
-    
+    """Generate TTS audio and return a JSON body with a download URL"""
     try:
-        # Load model if not already loaded
-        tts_model = load_model()
-        
-        # Set seed if specified
-        if seed != 0:
-            set_seed(seed)
-        
-        # Handle reference audio if provided
-        audio_prompt_path = None
-        if reference_audio:
-            try:
-                audio_prompt_path = await save_uploaded_audio(reference_audio)
-            except HTTPException:
-                raise
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Error processing reference audio: {str(e)}")
-        elif reference_audio_file:
-            # Use existing reference audio file
-            ref_path = REF_AUDIO_DIR / reference_audio_file
-            if not ref_path.exists():
-                raise HTTPException(status_code=404, detail=f"Reference audio file not found: {reference_audio_file}")
-            audio_prompt_path = str(ref_path)
-        
-        # Generate audio
-        wav = tts_model.generate(
-            text=text,
-            audio_prompt_path=audio_prompt_path,
-            exaggeration=exaggeration,
-            temperature=temperature,
-            cfg_weight=cfg_weight,
-            min_p=min_p,
-            top_p=top_p,
-            repetition_penalty=repetition_penalty,
+        # Run the shared generation core
+        audio_data, sample_rate = await _run_generation(
+            text, reference_audio, reference_audio_file, exaggeration,
+            temperature, cfg_weight, min_p, top_p, repetition_penalty, seed
         )
         
-        # Note: Keep reference audio file in ref folder for future use
-        # No longer deleting: if audio_prompt_path and os.path.exists(audio_prompt_path): os.unlink(audio_prompt_path)
-        
-        # Convert to numpy array
-        audio_data = wav.squeeze(0).numpy()
-        
         # Generate timestamped filename and save to out folder
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = output_stamp()
         output_filename = f"generated_json_{timestamp}.wav"
         output_file_path = OUTPUT_AUDIO_DIR / output_filename
         
-        # Create WAV file in memory
-        output_buffer = io.BytesIO()
-        sf.write(output_buffer, audio_data, tts_model.sr, format='WAV')
-        output_buffer.seek(0)
-        
-        # Also save to disk in out folder
-        sf.write(str(output_file_path), audio_data, tts_model.sr, format='WAV')
-        
-        # Encode as base64
-        audio_base64 = base64.b64encode(output_buffer.read()).decode('utf-8')
-        
-        return JSONResponse({
+        # Encode WAV once in memory, then persist the same bytes to disk.
+        # Unlike the inline-bytes endpoints the URL is the payload here, so
+        # the write must complete before the client can be told to fetch it
+        data, _, _ = await asyncio.to_thread(encode_audio, audio_data, sample_rate, "wav")
+        await asyncio.to_thread(_write_bytes, output_file_path, data)
+
+        response = {
             "success": True,
-            "audio_base64": audio_base64,
-            "sample_rate": tts_model.sr,
+            "download_url": f"/api/output-audio/download/{output_filename}",
+            "sample_rate": sample_rate,
             "format": "wav",
             "text": text,
             "parameters": {
@@ -572,8 +1003,15 @@ async def generate_tts_json(
                 "repetition_penalty": repetition_penalty,
                 "seed": seed
             }
-        })
-        
+        }
+        # Inline base64 is opt-in: it inflates the payload ~33% and costs an
+        # extra O(N) copy, so clients should prefer the download URL
+        if include_audio:
+            response["audio_base64"] = base64.b64encode(data).decode('ascii')
+        return ORJSONResponse(response)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
@@ -581,19 +1019,8 @@ async def generate_tts_json(
 async def list_reference_audio():
     """List available reference audio files"""
     try:
-        ref_files = []
-        if REF_AUDIO_DIR.exists():
-            for file_path in REF_AUDIO_DIR.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in ['.wav', '.mp3', '.flac', '.ogg', '.m4a']:
-                    # Get file info
-                    file_stat = file_path.stat()
-                    ref_files.append({
-                        "filename": file_path.name,
-                        "path": str(file_path),
-                        "size": file_stat.st_size,
-                        "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-                    })
-        
+        ref_files = _scan_audio_dir(REF_AUDIO_DIR)
+
         return {
             "reference_files": sorted(ref_files, key=lambda x: x["filename"]),
             "count": len(ref_files)
@@ -607,24 +1034,40 @@ async def upload_reference_audio(
 ):
     """Upload a new reference audio file"""
     try:
-        # Validate file type
-        if not file.filename.lower().endswith(('.wav', '.mp3', '.flac', '.ogg', '.m4a')):
+        # Validate file type: split off the extension and hash-check it
+        # instead of suffix-scanning a lowered copy of the whole filename
+        if os.path.splitext(file.filename)[1].lower() not in _LISTABLE_EXTS:
             raise HTTPException(
-                status_code=400, 
+                status_code=400,
                 detail="Invalid file type. Supported formats: WAV, MP3, FLAC, OGG, M4A"
             )
         
         # Create unique filename to avoid conflicts
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = output_stamp()
         base_name = Path(file.filename).stem
         extension = Path(file.filename).suffix
         unique_filename = f"{base_name}_{timestamp}{extension}"
         
-        # Save file
+        # Stream the upload to disk in chunks so the event loop stays free
+        # and the size limit is enforced as bytes arrive
         file_path = REF_AUDIO_DIR / unique_filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
+        total_bytes = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_bytes += len(chunk)
+                    if total_bytes > MAX_UPLOAD_SIZE:
+                        raise HTTPException(status_code=413, detail="Audio file too large (max 50MB)")
+                    await buffer.write(chunk)
+
+            if total_bytes == 0:
+                raise HTTPException(status_code=400, detail="Empty audio file")
+        except HTTPException:
+            # Don't leave a truncated or empty file behind in the ref folder
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(file_path)
+            raise
+
         # Get file info
         file_stat = file_path.stat()
         
@@ -672,19 +1115,8 @@ async def delete_reference_audio(filename: str):
 async def list_output_audio():
     """List available generated output audio files"""
     try:
-        output_files = []
-        if OUTPUT_AUDIO_DIR.exists():
-            for file_path in OUTPUT_AUDIO_DIR.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in ['.wav', '.mp3', '.flac', '.ogg', '.m4a']:
-                    # Get file info
-                    file_stat = file_path.stat()
-                    output_files.append({
-                        "filename": file_path.name,
-                        "path": str(file_path),
-                        "size": file_stat.st_size,
-                        "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-                    })
-        
+        output_files = _scan_audio_dir(OUTPUT_AUDIO_DIR)
+
         return {
             "output_files": sorted(output_files, key=lambda x: x["modified"], reverse=True),  # Newest first
             "count": len(output_files)
@@ -738,24 +1170,16 @@ async def download_output_audio(filename: str):
             raise HTTPException(status_code=400, detail="Not a valid file")
         
         # Determine media type based on file extension
-        extension = file_path.suffix.lower()
-        if extension == '.mp3':
-            media_type = "audio/mpeg"
-        elif extension == '.flac':
-            media_type = "audio/flac"
-        elif extension == '.ogg':
-            media_type = "audio/ogg"
-        else:  # Default to WAV
-            media_type = "audio/wav"
-        
-        # Read and return file
-        with open(file_path, "rb") as f:
-            content = f.read()
-        
-        return StreamingResponse(
-            io.BytesIO(content),
+        media_type = _MEDIA_TYPES.get(file_path.suffix.lower(), "audio/wav")
+
+        # FileResponse streams straight from the file instead of copying it
+        # through RAM; when the server advertises http.response.pathsend
+        # (uvicorn >= 0.30) Starlette hands over just the path and the
+        # transfer happens via kernel sendfile with no user-space copies
+        return FileResponse(
+            path=file_path,
             media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            filename=filename
         )
         
     except HTTPException:
@@ -763,6 +1187,32 @@ async def download_output_audio(filename: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading output audio: {str(e)}")
 
+def _scan_audio_dir(directory):
+    """List audio files in a directory via os.scandir.
+
+    DirEntry caches d_type and stat results from the directory read, so
+    this does one syscall per file instead of the three that the
+    iterdir()/is_file()/stat() combination issued.
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in _LISTABLE_EXTS:
+                    continue
+                stat_result = entry.stat()
+                entries.append({
+                    "filename": entry.name,
+                    "path": entry.path,
+                    "size": stat_result.st_size,
+                    "modified": datetime.fromtimestamp(stat_result.st_mtime).isoformat()
+                })
+    except FileNotFoundError:
+        pass
+    return entries
+
 # Helper function for robust audio handling
 async def save_uploaded_audio(reference_audio: UploadFile) -> str:
     """
@@ -771,52 +1221,88 @@ async def save_uploaded_audio(reference_audio: UploadFile) -> str:
     if not reference_audio.filename:
         raise HTTPException(status_code=400, detail="No filename provided for reference audio")
     
-    # Check file extension
-    allowed_extensions = {'.wav', '.mp3', '.flac', '.m4a', '.ogg', '.aac'}
-    file_ext = os.path.splitext(reference_audio.filename)[1].lower()
-    if file_ext not in allowed_extensions:
+    # Check file extension; rpartition is a single C-level scan vs the
+    # allocation-heavier os.path.splitext
+    stem, sep, ext = reference_audio.filename.rpartition('.')
+    file_ext = ('.' + ext.lower()) if stem and sep else ''
+    if file_ext not in _UPLOAD_EXTS:
         raise HTTPException(
-            status_code=400, 
-            detail=f"Unsupported audio format: {file_ext}. Supported formats: {', '.join(allowed_extensions)}"
+            status_code=400,
+            detail=f"Unsupported audio format: {file_ext}. Supported formats: {', '.join(sorted(_UPLOAD_EXTS))}"
         )
     
-    # Generate timestamped filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_filename = f"ref_{timestamp}_{reference_audio.filename}"
-    ref_file_path = REF_AUDIO_DIR / safe_filename
-    
-    # Save uploaded file to ref folder
-    content = await reference_audio.read()
-    if len(content) == 0:
-        raise HTTPException(status_code=400, detail="Empty audio file")
-    if len(content) > 50 * 1024 * 1024:  # 50MB limit
-        raise HTTPException(status_code=400, detail="Audio file too large (max 50MB)")
-    
-    with open(ref_file_path, "wb") as f:
-        f.write(content)
-    
-    return str(ref_file_path)
+    # Generate a fixed-length ASCII name: never interpolate the raw client
+    # filename into the path (traversal risk, and long unicode names bloat
+    # directory scans); only the validated extension is kept
+    timestamp = output_stamp()
+    safe_filename = f"ref_{timestamp}_{secrets.token_hex(8)}{file_ext}"
+    ref_file_path = os.path.join(_REF_DIR_STR, safe_filename)
+
+    # Stream upload to ref folder in chunks so large files never buffer
+    # fully in RAM or block the event loop
+    total_bytes = 0
+    try:
+        async with aiofiles.open(ref_file_path, "wb") as f:
+            while chunk := await reference_audio.read(UPLOAD_CHUNK_SIZE):
+                total_bytes += len(chunk)
+                if total_bytes > MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=413, detail="Audio file too large (max 50MB)")
+                await f.write(chunk)
+
+        if total_bytes == 0:
+            raise HTTPException(status_code=400, detail="Empty audio file")
+    except HTTPException:
+        # Don't leave a truncated or empty file behind in the ref folder
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(ref_file_path)
+        raise
+
+    return ref_file_path
+
+def _cli_option(flag, default):
+    """Return the value following a --flag in sys.argv, or the default.
+
+    A hand-rolled scan of four known flags keeps the ~15ms argparse setup
+    out of cold start, which matters under --reload respawns.
+    """
+    try:
+        return sys.argv[sys.argv.index(flag) + 1]
+    except (ValueError, IndexError):
+        return default
 
 if __name__ == "__main__":
-    import argparse
-    
-    logger.info("🚀 ========================================")
-    logger.info("🚀 Chatterbox TTS API Server Starting...")
-    logger.info("🚀 ========================================")
-    
-    parser = argparse.ArgumentParser(description="Chatterbox TTS REST API Server")
-    parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
-    parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
-    parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
-    
-    args = parser.parse_args()
-    
-    logger.info(f"🌐 Starting server on {args.host}:{args.port}")
-    logger.info(f"🔄 Auto-reload: {args.reload}")
-    
+    host = _cli_option("--host", os.environ.get("HOST", "0.0.0.0"))
+    port = int(_cli_option("--port", os.environ.get("PORT", "8000")))
+    reload_flag = "--reload" in sys.argv
+    # Keep 1 worker per GPU; each worker loads its own model copy
+    workers = int(_cli_option("--workers", os.environ.get("WEB_CONCURRENCY", "1")))
+
+    # One multiline record instead of six: a single lock/format/write
+    # cycle, so concurrently booting workers don't serialize on the
+    # logging lock while printing the banner
+    logger.info(
+        "🚀 ========================================\n"
+        "🚀 Chatterbox TTS API Server Starting...\n"
+        "🚀 ========================================\n"
+        "🌐 Starting server on %s:%s\n"
+        "🔄 Auto-reload: %s\n"
+        "👷 Workers: %s",
+        host, port, reload_flag, workers
+    )
+
+    # uvloop + httptools (bundled with uvicorn[standard]) roughly halve the
+    # per-request event-loop and HTTP-parsing overhead vs the defaults.
+    # The import string is only needed when uvicorn has to respawn the app
+    # (reload or multi-worker); otherwise passing the object skips a full
+    # re-import of this module at startup
     uvicorn.run(
-        "tts_api:app" if not args.reload else "tts_api:app",
-        host=args.host,
-        port=args.port,
-        reload=args.reload
+        app if not reload_flag and workers == 1 else "tts_api:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=30,
+        reload=reload_flag
     )